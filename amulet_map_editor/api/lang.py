@@ -108,7 +108,9 @@ register_lang_directory(
 
 
 def get(unique_identifier):
-    if unique_identifier not in _lang:
+    try:
+        return _lang[unique_identifier]
+    except KeyError:
         # help debugging referenced lang entries that do not exist
         log.info(f"Could not find lang entry for {unique_identifier}")
-    return _lang.get(unique_identifier, unique_identifier)
+        return unique_identifier
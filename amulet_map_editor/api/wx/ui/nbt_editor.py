@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-from functools import partial
-from collections.abc import MutableMapping, MutableSequence
+from enum import IntEnum
 
 import wx
 
@@ -15,6 +14,65 @@ nbt_resources = image.nbt
 
 NBT_FILE = b"\x0A\x00\x0B\x68\x65\x6C\x6C\x6F\x20\x77\x6F\x72\x6C\x64\x08\x00\x04\x6E\x61\x6D\x65\x00\x09\x42\x61\x6E\x61\x6E\x72\x61\x6D\x61\x00"
 
+# the tag classes the user can create, looked up by class name.
+_TAG_BY_NAME = {
+    tag_class.__name__: tag_class
+    for tag_class in (
+        nbt.TAG_Byte,
+        nbt.TAG_Short,
+        nbt.TAG_Int,
+        nbt.TAG_Long,
+        nbt.TAG_Float,
+        nbt.TAG_Double,
+        nbt.TAG_String,
+        nbt.TAG_Compound,
+        nbt.TAG_List,
+        nbt.TAG_Byte_Array,
+        nbt.TAG_Int_Array,
+        nbt.TAG_Long_Array,
+    )
+}
+
+
+def _parse_int(value: str) -> int:
+    try:
+        return int(value)
+    except ValueError:
+        # allow values like 1.5 and 1e3
+        return int(float(value))
+
+
+# the functions to convert the value field text for numerical tag types.
+# Other tag types keep the text as it is.
+_VALUE_PARSERS = {
+    "TAG_Byte": _parse_int,
+    "TAG_Short": _parse_int,
+    "TAG_Int": _parse_int,
+    "TAG_Long": _parse_int,
+    "TAG_Float": float,
+    "TAG_Double": float,
+}
+
+
+_CONTAINER_TAGS = (nbt.TAG_Compound, nbt.TAG_List)
+_ARRAY_TAGS = (nbt.TAG_Byte_Array, nbt.TAG_Int_Array, nbt.TAG_Long_Array)
+
+
+def _value_text(tag) -> str:
+    """The text to show in the tree for the value of a tag."""
+    if isinstance(tag, _ARRAY_TAGS):
+        # formatting the contents of a large array is slow and unreadable.
+        return f"[{len(tag)} entries]"
+    return f"{tag.value}"
+
+
+class _MenuOperation(IntEnum):
+    """Fixed ids for the items in the tag right click menu."""
+
+    ADD = wx.ID_HIGHEST + 1
+    EDIT = wx.ID_HIGHEST + 2
+    DELETE = wx.ID_HIGHEST + 3
+
 
 class NBTRadioButton(simple.SimplePanel):
     def __init__(self, parent, nbt_tag_class, icon):
@@ -38,31 +96,18 @@ class NBTRadioButton(simple.SimplePanel):
 
 
 class NBTEditor(simple.SimplePanel):
+    _shared_image_list = None
+    _shared_image_map = {}
+
     def __init__(self, parent, nbt_data, root_tag_name="", callback=None):
         super(NBTEditor, self).__init__(parent)
 
         self.nbt_data = nbt_data
 
-        self.image_list = wx.ImageList(16, 16)
-        self.image_map = {
-            nbt.TAG_Byte: self.image_list.Add(nbt_resources.nbt_tag_byte.bitmap()),
-            nbt.TAG_Short: self.image_list.Add(nbt_resources.nbt_tag_short.bitmap()),
-            nbt.TAG_Int: self.image_list.Add(nbt_resources.nbt_tag_int.bitmap()),
-            nbt.TAG_Long: self.image_list.Add(nbt_resources.nbt_tag_long.bitmap()),
-            nbt.TAG_Float: self.image_list.Add(nbt_resources.nbt_tag_float.bitmap()),
-            nbt.TAG_Double: self.image_list.Add(nbt_resources.nbt_tag_double.bitmap()),
-            nbt.TAG_String: self.image_list.Add(nbt_resources.nbt_tag_string.bitmap()),
-            nbt.TAG_Compound: self.image_list.Add(
-                nbt_resources.nbt_tag_compound.bitmap()
-            ),
-            nbt.NBTFile: self.image_list.ImageCount - 1,
-            nbt.TAG_List: self.image_list.Add(nbt_resources.nbt_tag_list.bitmap()),
-            nbt.TAG_Byte_Array: self.image_list.Add(
-                nbt_resources.nbt_tag_array.bitmap()
-            ),
-            nbt.TAG_Int_Array: self.image_list.ImageCount - 1,
-            nbt.TAG_Long_Array: self.image_list.ImageCount - 1,
-        }
+        # the image list is shared between editors so the bitmaps are only loaded once.
+        self._ensure_image_list()
+        self.image_list = self._shared_image_list
+        self.image_map = self._shared_image_map
         self.other = self.image_map[nbt.TAG_String]
 
         self.tree = self.build_tree(root_tag_name)
@@ -82,6 +127,36 @@ class NBTEditor(simple.SimplePanel):
 
         self.callback = callback
 
+        self._add_dialog = None
+        self._add_target = None
+        self._edit_dialog = None
+        self._edit_target = None
+
+    @classmethod
+    def _ensure_image_list(cls):
+        if cls._shared_image_list is None:
+            image_list = wx.ImageList(16, 16)
+            cls._shared_image_map = {
+                nbt.TAG_Byte: image_list.Add(nbt_resources.nbt_tag_byte.bitmap()),
+                nbt.TAG_Short: image_list.Add(nbt_resources.nbt_tag_short.bitmap()),
+                nbt.TAG_Int: image_list.Add(nbt_resources.nbt_tag_int.bitmap()),
+                nbt.TAG_Long: image_list.Add(nbt_resources.nbt_tag_long.bitmap()),
+                nbt.TAG_Float: image_list.Add(nbt_resources.nbt_tag_float.bitmap()),
+                nbt.TAG_Double: image_list.Add(nbt_resources.nbt_tag_double.bitmap()),
+                nbt.TAG_String: image_list.Add(nbt_resources.nbt_tag_string.bitmap()),
+                nbt.TAG_Compound: image_list.Add(
+                    nbt_resources.nbt_tag_compound.bitmap()
+                ),
+                nbt.NBTFile: image_list.ImageCount - 1,
+                nbt.TAG_List: image_list.Add(nbt_resources.nbt_tag_list.bitmap()),
+                nbt.TAG_Byte_Array: image_list.Add(
+                    nbt_resources.nbt_tag_array.bitmap()
+                ),
+                nbt.TAG_Int_Array: image_list.ImageCount - 1,
+                nbt.TAG_Long_Array: image_list.ImageCount - 1,
+            }
+            cls._shared_image_list = image_list
+
     def commit(self, evt):
         self.callback(self.nbt_data)
         evt.Skip()
@@ -91,33 +166,10 @@ class NBTEditor(simple.SimplePanel):
         evt.Skip()
 
     def build_tree(self, root_tag_name=""):
-        def add_tree_node(_tree: wx.TreeCtrl, _parent, _items):
-            for key, value in _items.items():
-                new_child = None
-                if isinstance(value, MutableMapping):
-                    new_child = _tree.AppendItem(_parent, key)
-                    add_tree_node(_tree, new_child, value)
-                elif isinstance(value, MutableSequence):
-                    new_child = _tree.AppendItem(_parent, key)
-
-                    for i, item in enumerate(value):
-                        child_child = _tree.AppendItem(new_child, f"{item.value}")
-                        tree.SetItemData(child_child, (i, item))
-                        tree.SetItemImage(
-                            child_child,
-                            self.image_map.get(item.__class__, self.other),
-                            wx.TreeItemIcon_Normal,
-                        )
-                else:
-                    new_child = _tree.AppendItem(_parent, f"{key}: {value.value}")
-
-                tree.SetItemData(new_child, (key, value))
-                tree.SetItemImage(
-                    new_child, self.image_map.get(value.__class__, self.other)
-                )
-
         tree = wx.TreeCtrl(self, style=wx.TR_DEFAULT_STYLE | wx.EXPAND | wx.ALL)
-        tree.AssignImageList(self.image_list)
+        # the image list is shared so the tree must not take ownership of it.
+        tree.SetImageList(self.image_list)
+        tree.Freeze()
 
         root = tree.AddRoot(root_tag_name)
         tree.SetItemData(root, (root_tag_name, self.nbt_data))
@@ -129,53 +181,83 @@ class NBTEditor(simple.SimplePanel):
             wx.TreeItemIcon_Normal,
         )
 
-        add_tree_node(tree, root, self.nbt_data)
+        # only the first level is created here. Deeper levels are created when expanded.
+        self._populate_item(tree, root)
 
+        tree.Thaw()
         tree.Bind(wx.EVT_TREE_ITEM_RIGHT_CLICK, self.tree_right_click)
+        tree.Bind(wx.EVT_TREE_ITEM_EXPANDING, self._on_item_expanding)
 
         return tree
 
+    def _on_item_expanding(self, evt):
+        self.tree.Freeze()
+        self._populate_item(self.tree, evt.GetItem())
+        self.tree.Thaw()
+        evt.Skip()
+
+    def _populate_item(self, tree: wx.TreeCtrl, parent: wx.TreeItemId):
+        """Create the tree items for the children of a container tag.
+        Does nothing if the children have already been created.
+        Child containers are marked as expandable but their children are not created."""
+        if tree.GetChildrenCount(parent, False):
+            return
+        _, items = tree.GetItemData(parent)
+
+        # Children are prepended in reverse order. The result is the same
+        # but the native control does not walk the siblings on each insert.
+        if isinstance(items, nbt.TAG_List):
+            for i in range(len(items) - 1, -1, -1):
+                item = items[i]
+                tree.PrependItem(
+                    parent,
+                    _value_text(item),
+                    self.image_map.get(item.__class__, self.other),
+                    data=(i, item),
+                )
+        else:
+            for key, value in reversed(list(items.items())):
+                if isinstance(value, _CONTAINER_TAGS):
+                    new_child = tree.PrependItem(parent, key)
+                    if len(value):
+                        # empty containers have nothing to expand.
+                        tree.SetItemHasChildren(new_child, True)
+                else:
+                    new_child = tree.PrependItem(parent, f"{key}: {_value_text(value)}")
+
+                tree.SetItemData(new_child, (key, value))
+                tree.SetItemImage(
+                    new_child, self.image_map.get(value.__class__, self.other)
+                )
+
     def _generate_menu(self, include_add_tag=False):
         menu = wx.Menu()
 
-        menu_items = [
-            wx.MenuItem(menu, text="Edit Tag", id=wx.ID_ANY),
-            wx.MenuItem(menu, text="Delete Tag", id=wx.ID_ANY),
-        ]
-
         if include_add_tag:
-            menu_items.insert(0, wx.MenuItem(menu, text="Add Tag", id=wx.ID_ANY))
-
-        for menu_item in menu_items:
-            menu.Append(menu_item)
+            menu.Append(_MenuOperation.ADD, "Add Tag")
+        menu.Append(_MenuOperation.EDIT, "Edit Tag")
+        menu.Append(_MenuOperation.DELETE, "Delete Tag")
 
-        op_map = {
-            item.GetId(): item.GetItemLabelText().split()[0].lower()
-            for item in menu_items
-        }
-        menu.Bind(wx.EVT_MENU, lambda evt: self.popup_menu_handler(op_map, evt))
+        menu.Bind(wx.EVT_MENU, self.popup_menu_handler)
 
         return menu
 
     def tree_right_click(self, evt):
         tag_name, tag_obj = self.tree.GetItemData(evt.GetItem())
 
-        menu = self._generate_menu(
-            isinstance(tag_obj, (MutableMapping, MutableSequence))
-        )
+        menu = self._generate_menu(isinstance(tag_obj, _CONTAINER_TAGS))
         self.PopupMenu(menu, evt.GetPoint())
         menu.Destroy()
         evt.Skip()
 
-    def popup_menu_handler(self, op_map, evt):
+    def popup_menu_handler(self, evt):
         op_id = evt.GetId()
-        op_name = op_map[op_id]
 
-        if op_name == "add":
+        if op_id == _MenuOperation.ADD:
             self.add_tag()
-        elif op_name == "edit":
+        elif op_id == _MenuOperation.EDIT:
             self.edit_tag()
-        else:
+        elif op_id == _MenuOperation.DELETE:
             selected_tag = self.tree.GetFocusedItem()
 
             if selected_tag == self.tree.GetRootItem():
@@ -192,73 +274,79 @@ class NBTEditor(simple.SimplePanel):
 
             del parent_data[name]
 
+            if isinstance(parent_data, nbt.TAG_List):
+                # list entries are stored by index so the entries after
+                # the deleted one move down by one.
+                sibling = self.tree.GetNextSibling(selected_tag)
+                while sibling.IsOk():
+                    index, tag = self.tree.GetItemData(sibling)
+                    self.tree.SetItemData(sibling, (index - 1, tag))
+                    sibling = self.tree.GetNextSibling(sibling)
+
             self.tree.Delete(selected_tag)
 
     def add_tag(self):
         selected_tag = self.tree.GetFocusedItem()
-        name, data = self.tree.GetItemData(selected_tag)
+        # make sure the existing children exist before adding a new one.
+        self._populate_item(self.tree, selected_tag)
+        self._add_target = selected_tag
+
+        # the dialog is created once and reused for later tags.
+        if self._add_dialog is None:
+            self._add_dialog = EditTagDialog(
+                self,
+                "",
+                nbt.TAG_Byte(0),
+                list(_TAG_BY_NAME),
+                create=True,
+                save_callback=self._on_add_save,
+            )
+        else:
+            self._add_dialog.reset("", nbt.TAG_Byte(0), create=True)
+        self._add_dialog.Show()
+        self._add_dialog.Raise()
 
-        def save_func(new_name, new_tag_value, new_tag_type, _):
-            tag_type = [
-                tag_class
-                for tag_class in self.image_map
-                if tag_class.__name__ == new_tag_type
-            ][0]
-            self.nbt_data[new_name] = nbt_tag = tag_type(new_tag_value)
+    def _on_add_save(self, new_name, new_tag_value, new_tag_type, _):
+        selected_tag = self._add_target
+        tag_type = _TAG_BY_NAME[new_tag_type]
+        self.nbt_data[new_name] = nbt_tag = tag_type(new_tag_value)
 
-            new_child = self.tree.AppendItem(
-                selected_tag, f"{new_name}: {new_tag_value}"
-            )
-            self.tree.SetItemImage(new_child, self.image_map.get(tag_type, self.other))
-            self.tree.SetItemData(new_child, (new_name, nbt_tag))
-
-        add_dialog = EditTagDialog(
-            self,
-            "",
-            nbt.TAG_Byte(0),
-            [
-                tag_type.__name__
-                for tag_type in self.image_map.keys()
-                if "TAG_" in tag_type.__name__
-            ],
-            create=True,
-            save_callback=save_func,
+        new_child = self.tree.AppendItem(
+            selected_tag, f"{new_name}: {_value_text(nbt_tag)}"
         )
-        add_dialog.Show()
+        self.tree.SetItemImage(new_child, self.image_map.get(tag_type, self.other))
+        self.tree.SetItemData(new_child, (new_name, nbt_tag))
 
     def edit_tag(self):
         selected_tag = self.tree.GetFocusedItem()
         name, data = self.tree.GetItemData(selected_tag)
+        self._edit_target = selected_tag
+
+        # the dialog is created once and reused for later tags.
+        if self._edit_dialog is None:
+            self._edit_dialog = EditTagDialog(
+                self,
+                name,
+                data,
+                list(_TAG_BY_NAME),
+                save_callback=self._on_edit_save,
+            )
+        else:
+            self._edit_dialog.reset(name, data)
+        self._edit_dialog.Show()
+        self._edit_dialog.Raise()
 
-        def save_func(new_name, new_tag_value, new_tag_type, old_name):
-            tag_type = [
-                tag_class
-                for tag_class in self.image_map
-                if tag_class.__name__ == new_tag_type
-            ][0]
+    def _on_edit_save(self, new_name, new_tag_value, new_tag_type, old_name):
+        selected_tag = self._edit_target
+        tag_type = _TAG_BY_NAME[new_tag_type]
 
-            self.nbt_data[new_name] = nbt_tag = tag_type(new_tag_value)
-            self.tree.SetItemImage(
-                selected_tag, self.image_map.get(tag_type, self.other)
-            )
-            self.tree.SetItemData(selected_tag, (new_name, nbt_tag))
-            self.tree.SetItemText(selected_tag, f"{new_name}: {new_tag_value}")
-
-            if new_name != old_name:
-                del self.nbt_data[old_name]
-
-        edit_dialog = EditTagDialog(
-            self,
-            name,
-            data,
-            [
-                tag_type.__name__
-                for tag_type in self.image_map.keys()
-                if "TAG_" in tag_type.__name__
-            ],
-            save_callback=save_func,
-        )
-        edit_dialog.Show()
+        self.nbt_data[new_name] = nbt_tag = tag_type(new_tag_value)
+        self.tree.SetItemImage(selected_tag, self.image_map.get(tag_type, self.other))
+        self.tree.SetItemData(selected_tag, (new_name, nbt_tag))
+        self.tree.SetItemText(selected_tag, f"{new_name}: {_value_text(nbt_tag)}")
+
+        if new_name != old_name:
+            del self.nbt_data[old_name]
 
 
 class EditTagDialog(wx.Frame):
@@ -273,8 +361,6 @@ class EditTagDialog(wx.Frame):
         )
 
         self.save_callback = save_callback
-        self.old_name = tag_name
-        self.data_type_func = lambda x: x
 
         main_panel = simple.SimplePanel(self)
 
@@ -286,42 +372,32 @@ class EditTagDialog(wx.Frame):
         name_label = wx.StaticText(name_panel, label="Name: ")
         self.name_field = wx.TextCtrl(name_panel)
 
-        if tag_name == "" and not create:
-            self.name_field.Disable()
-        else:
-            self.name_field.SetValue(tag_name)
-
         name_panel.add_object(name_label, space=0, options=wx.ALL | wx.CENTER)
         name_panel.add_object(self.name_field, space=1, options=wx.ALL | wx.EXPAND)
 
         value_label = wx.StaticText(value_panel, label="Value: ")
         self.value_field = wx.TextCtrl(value_panel)
 
-        if isinstance(tag, (nbt.TAG_Compound, nbt.TAG_List)):
-            self.value_field.Disable()
-        else:
-            self.value_field.SetValue(str(tag.value))
-
         value_panel.add_object(value_label, space=0, options=wx.ALL | wx.CENTER)
         value_panel.add_object(self.value_field, space=1, options=wx.ALL | wx.EXPAND)
 
         tag_type_sizer = wx.GridSizer(self.GRID_ROWS, self.GRID_COLUMNS, 0, 0)
 
-        self.radio_buttons = []
+        # the radio buttons are in separate panels so wx does not group them.
+        # Track the selected one so that only it needs clearing on change.
+        self.radio_buttons = {}
+        self._selected_tag_type = None
 
         for tag_type in tag_types:
             rd_btn = NBTRadioButton(
                 tag_type_panel,
                 tag_type,
-                parent.image_list.GetBitmap(parent.image_map[getattr(nbt, tag_type)]),
+                parent.image_list.GetBitmap(parent.image_map[_TAG_BY_NAME[tag_type]]),
             )
-            self.radio_buttons.append(rd_btn)
-            rd_btn.Bind(wx.EVT_RADIOBUTTON, partial(self.handle_radio_button, tag_type))
+            self.radio_buttons[tag_type] = rd_btn
+            rd_btn.Bind(wx.EVT_RADIOBUTTON, self.handle_radio_button)
             tag_type_sizer.Add(rd_btn, 0, wx.ALL, 0)
 
-            if tag_type == tag.__class__.__name__:
-                rd_btn.SetValue(True)
-
         tag_type_panel.SetSizerAndFit(tag_type_sizer)
 
         self.save_button = wx.Button(button_panel, label="Save")
@@ -338,26 +414,61 @@ class EditTagDialog(wx.Frame):
         self.save_button.Bind(wx.EVT_BUTTON, self.save)
         self.cancel_button.Bind(wx.EVT_BUTTON, lambda evt: self.Close())
 
+        self.reset(tag_name, tag, create)
         self.value_field.Bind(wx.EVT_TEXT, self.value_changed)
+        self.Bind(wx.EVT_CLOSE, self._on_close)
 
         self.SetSize((235, 260))
         self.Layout()
 
+    def reset(self, tag_name, tag, create=False):
+        """Set up the fields for a different tag so that the dialog can be reused."""
+        self.old_name = tag_name
+        self.data_type_func = str
+
+        if tag_name == "" and not create:
+            self.name_field.Disable()
+        else:
+            self.name_field.Enable()
+        self.name_field.ChangeValue(tag_name)
+
+        if isinstance(tag, _CONTAINER_TAGS):
+            self.value_field.Disable()
+            self.value_field.ChangeValue("")
+        else:
+            self.value_field.Enable()
+            self.value_field.ChangeValue(str(tag.value))
+
+        if self._selected_tag_type is not None:
+            self.radio_buttons[self._selected_tag_type].SetValue(False)
+        self._selected_tag_type = None
+        tag_type = tag.__class__.__name__
+        if tag_type in self.radio_buttons:
+            self.radio_buttons[tag_type].SetValue(True)
+            self._selected_tag_type = tag_type
+
+    def _on_close(self, evt):
+        if evt.CanVeto():
+            # hide the dialog rather than destroying it so that it can be reused.
+            self.Hide()
+            evt.Veto()
+        else:
+            evt.Skip()
+
     def value_changed(self, evt):
         tag_value = evt.GetString()
         self.value_field.ChangeValue(str(self.data_type_func(tag_value)))
 
-    def handle_radio_button(self, tag_type, evt):
-        for rd_btn in self.radio_buttons:
-            rd_btn.SetValue(rd_btn.nbt_tag_class == tag_type)
+    def handle_radio_button(self, evt):
+        # the event comes from the wx.RadioButton inside the NBTRadioButton
+        tag_type = evt.GetEventObject().GetParent().nbt_tag_class
+        if self._selected_tag_type not in (None, tag_type):
+            self.radio_buttons[self._selected_tag_type].SetValue(False)
+        self._selected_tag_type = tag_type
         self.change_tag_type_func(tag_type)
 
     def change_tag_type_func(self, tag_type):
-        self.data_type_func = lambda x: x
-        if tag_type in ("TAG_Int", "TAG_Long", "TAG_Short", "TAG_Short", "TAG_Byte"):
-            self.data_type_func = lambda x: int(float(x))
-        elif tag_type in ("TAG_Float", "TAG_Double"):
-            self.data_type_func = float
+        self.data_type_func = _VALUE_PARSERS.get(tag_type, str)
 
         if tag_type not in ("TAG_Byte_Array", "TAG_Int_Array", "TAG_Long_Array"):
             self.value_field.ChangeValue(
@@ -365,10 +476,7 @@ class EditTagDialog(wx.Frame):
             )
 
     def get_selected_tag_type(self):
-        for rd_btn in self.radio_buttons:
-            if rd_btn.GetValue():
-                return rd_btn.nbt_tag_class
-        return None
+        return self._selected_tag_type
 
     def save(self, evt):
         self.save_callback(
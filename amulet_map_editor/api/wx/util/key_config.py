@@ -230,45 +230,57 @@ _mouse_events = {
     wx.EVT_MOUSE_AUX2_DOWN.evtType[0]: MouseAux2,
     wx.EVT_MOUSE_AUX2_UP.evtType[0]: MouseAux2,
 }
+_mouse_wheel_event = wx.EVT_MOUSEWHEEL.evtType[0]
+
+
+# the serialised name of every key code that has one.
+# The printable ascii characters serialise as their upper case character.
+_key_names: Dict[int, str] = {key: chr(key).upper() for key in range(33, 127)}
+_key_names.update(key_string_map)
+
+_modifier_mask = wx.MOD_CONTROL | wx.MOD_SHIFT | wx.MOD_ALT
+# the serialised modifier for each combination of modifier bits.
+# Shift and alt are only modifiers if control is also pressed.
+_modifiers: Dict[int, ModifierType] = {
+    0: (),
+    wx.MOD_SHIFT: (),
+    wx.MOD_ALT: (),
+    wx.MOD_SHIFT | wx.MOD_ALT: (),
+    wx.MOD_CONTROL: (Control,),
+    wx.MOD_CONTROL | wx.MOD_SHIFT: (Control, Shift),
+    wx.MOD_CONTROL | wx.MOD_ALT: (Control, Alt),
+    wx.MOD_CONTROL | wx.MOD_SHIFT | wx.MOD_ALT: (Control, Shift, Alt),
+}
 
 
 def serialise_modifier(
     evt: Union[wx.KeyEvent, wx.MouseEvent], key: int
 ) -> ModifierType:
+    if key in (wx.WXK_SHIFT, wx.WXK_ALT):
+        # if control is pressed the real key must not be a modifier
+        # so shift and alt on their own have no modifier.
+        return ()
+    return _modifiers[evt.GetModifiers() & _modifier_mask]
+
 
-    modifier = []
-    if evt.ControlDown():
-        if key not in (wx.WXK_SHIFT, wx.WXK_ALT):
-            # if control is pressed the real key must not be a modifier
-            modifier.append(Control)
-            if evt.ShiftDown():
-                modifier.append(Shift)
-            if evt.AltDown():
-                modifier.append(Alt)
-    return tuple(modifier)
+def _serialise_key_code(key: int) -> KeyType:
+    return _key_names.get(key) or f"UNKNOWN KEY {key}"
 
 
 def serialise_key(evt: Union[wx.KeyEvent, wx.MouseEvent]) -> Optional[KeyType]:
     """Get the serialised version of the key that was pressed/released."""
     if isinstance(evt, wx.KeyEvent):
-        key = evt.GetUnicodeKey() or evt.GetKeyCode()
-
-        if 33 <= key <= 126:
-            key = chr(key).upper()
-        elif key in key_string_map:
-            key = key_string_map[key]
-        else:
-            key = f"UNKNOWN KEY {key}"
-        return key
+        return _serialise_key_code(evt.GetUnicodeKey() or evt.GetKeyCode())
     elif isinstance(evt, wx.MouseEvent):
         key = evt.GetEventType()
-        if key in wx.EVT_MOUSEWHEEL.evtType:
-            if evt.GetWheelRotation() < 0:
+        if key in _mouse_events:
+            return _mouse_events[key]
+        elif key == _mouse_wheel_event:
+            rotation = evt.GetWheelRotation()
+            if rotation < 0:
                 return MouseWheelScrollDown
-            elif evt.GetWheelRotation() > 0:
+            elif rotation > 0:
                 return MouseWheelScrollUp
-        elif key in _mouse_events:
-            return _mouse_events[key]
 
 
 def serialise_key_event(
@@ -279,25 +291,18 @@ def serialise_key_event(
         key = evt.GetUnicodeKey() or evt.GetKeyCode()
         if key == wx.WXK_CONTROL:
             return
-        modifier = serialise_modifier(evt, key)
-
-        if 33 <= key <= 126:
-            key = chr(key).upper()
-        elif key in key_string_map:
-            key = key_string_map[key]
-        else:
-            key = f"UNKNOWN KEY {key}"
-        return modifier, key
+        return serialise_modifier(evt, key), _serialise_key_code(key)
     elif isinstance(evt, wx.MouseEvent):
         key = evt.GetEventType()
         modifier = serialise_modifier(evt, key)
-        if key in wx.EVT_MOUSEWHEEL.evtType:
-            if evt.GetWheelRotation() < 0:
+        if key in _mouse_events:
+            return modifier, _mouse_events[key]
+        elif key == _mouse_wheel_event:
+            rotation = evt.GetWheelRotation()
+            if rotation < 0:
                 return modifier, MouseWheelScrollDown
-            elif evt.GetWheelRotation() > 0:
+            elif rotation > 0:
                 return modifier, MouseWheelScrollUp
-        elif key in _mouse_events:
-            return modifier, _mouse_events[key]
 
 
 def stringify_key(key: SerialisedKeyType) -> str:
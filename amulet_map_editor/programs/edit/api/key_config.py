@@ -1,9 +1,13 @@
-from typing import List
+from typing import List, Dict, Mapping
+from types import MappingProxyType
 from amulet_map_editor.api.wx.util.key_config import (
     KeybindContainer,
     KeybindGroup,
     KeybindGroupIdType,
     KeyActionType,
+    KeyType,
+    ModifierType,
+    SerialisedKeyType,
     Space,
     Shift,
     MouseLeft,
@@ -53,84 +57,103 @@ KeybindKeys: List[KeyActionType] = [
     ACT_CHANGE_PROJECTION,
 ]
 
-PresetKeybinds: KeybindContainer = {
+_keys: Dict[SerialisedKeyType, SerialisedKeyType] = {}
+
+
+def _key(modifier: ModifierType, key: KeyType) -> SerialisedKeyType:
+    """Get the serialised key.
+    Equal keys return the same tuple so the presets do not each store a copy."""
+    serialised = (modifier, key)
+    return _keys.setdefault(serialised, serialised)
+
+
+_presets: KeybindContainer = {
     "right": {
-        ACT_MOVE_UP: ((), Space),
-        ACT_MOVE_DOWN: ((), Shift),
-        ACT_MOVE_FORWARDS: ((), "W"),
-        ACT_MOVE_BACKWARDS: ((), "S"),
-        ACT_MOVE_LEFT: ((), "A"),
-        ACT_MOVE_RIGHT: ((), "D"),
-        ACT_BOX_CLICK: ((), MouseLeft),
-        ACT_BOX_CLICK_ADD: ((Control,), MouseLeft),
-        ACT_CHANGE_MOUSE_MODE: ((), MouseRight),
-        ACT_INCR_SPEED: ((), MouseWheelScrollUp),
-        ACT_DECR_SPEED: ((), MouseWheelScrollDown),
-        ACT_INCR_SELECT_DISTANCE: ((), "R"),
-        ACT_DECR_SELECT_DISTANCE: ((), "F"),
-        ACT_DESELECT_ALL_BOXES: ((Control, Shift), "D"),
-        ACT_DELESECT_BOX: ((Control,), "D"),
-        ACT_INSPECT_BLOCK: ((), Alt),
-        ACT_CHANGE_PROJECTION: ((), Tab),
+        ACT_MOVE_UP: _key((), Space),
+        ACT_MOVE_DOWN: _key((), Shift),
+        ACT_MOVE_FORWARDS: _key((), "W"),
+        ACT_MOVE_BACKWARDS: _key((), "S"),
+        ACT_MOVE_LEFT: _key((), "A"),
+        ACT_MOVE_RIGHT: _key((), "D"),
+        ACT_BOX_CLICK: _key((), MouseLeft),
+        ACT_BOX_CLICK_ADD: _key((Control,), MouseLeft),
+        ACT_CHANGE_MOUSE_MODE: _key((), MouseRight),
+        ACT_INCR_SPEED: _key((), MouseWheelScrollUp),
+        ACT_DECR_SPEED: _key((), MouseWheelScrollDown),
+        ACT_INCR_SELECT_DISTANCE: _key((), "R"),
+        ACT_DECR_SELECT_DISTANCE: _key((), "F"),
+        ACT_DESELECT_ALL_BOXES: _key((Control, Shift), "D"),
+        ACT_DELESECT_BOX: _key((Control,), "D"),
+        ACT_INSPECT_BLOCK: _key((), Alt),
+        ACT_CHANGE_PROJECTION: _key((), Tab),
     },
     "right_laptop": {
-        ACT_MOVE_UP: ((), Space),
-        ACT_MOVE_DOWN: ((), Shift),
-        ACT_MOVE_FORWARDS: ((), "W"),
-        ACT_MOVE_BACKWARDS: ((), "S"),
-        ACT_MOVE_LEFT: ((), "A"),
-        ACT_MOVE_RIGHT: ((), "D"),
-        ACT_BOX_CLICK: ((), MouseLeft),
-        ACT_BOX_CLICK_ADD: ((Control,), MouseLeft),
-        ACT_CHANGE_MOUSE_MODE: ((), MouseRight),
-        ACT_INCR_SPEED: ((), "."),
-        ACT_DECR_SPEED: ((), ","),
-        ACT_INCR_SELECT_DISTANCE: ((), "R"),
-        ACT_DECR_SELECT_DISTANCE: ((), "F"),
-        ACT_DESELECT_ALL_BOXES: ((Control, Shift), "D"),
-        ACT_DELESECT_BOX: ((Control,), "D"),
-        ACT_INSPECT_BLOCK: ((), Alt),
-        ACT_CHANGE_PROJECTION: ((), Tab),
+        ACT_MOVE_UP: _key((), Space),
+        ACT_MOVE_DOWN: _key((), Shift),
+        ACT_MOVE_FORWARDS: _key((), "W"),
+        ACT_MOVE_BACKWARDS: _key((), "S"),
+        ACT_MOVE_LEFT: _key((), "A"),
+        ACT_MOVE_RIGHT: _key((), "D"),
+        ACT_BOX_CLICK: _key((), MouseLeft),
+        ACT_BOX_CLICK_ADD: _key((Control,), MouseLeft),
+        ACT_CHANGE_MOUSE_MODE: _key((), MouseRight),
+        ACT_INCR_SPEED: _key((), "."),
+        ACT_DECR_SPEED: _key((), ","),
+        ACT_INCR_SELECT_DISTANCE: _key((), "R"),
+        ACT_DECR_SELECT_DISTANCE: _key((), "F"),
+        ACT_DESELECT_ALL_BOXES: _key((Control, Shift), "D"),
+        ACT_DELESECT_BOX: _key((Control,), "D"),
+        ACT_INSPECT_BLOCK: _key((), Alt),
+        ACT_CHANGE_PROJECTION: _key((), Tab),
     },
     "left": {
-        ACT_MOVE_UP: ((), Space),
-        ACT_MOVE_DOWN: ((), ";"),
-        ACT_MOVE_FORWARDS: ((), "I"),
-        ACT_MOVE_BACKWARDS: ((), "K"),
-        ACT_MOVE_LEFT: ((), "J"),
-        ACT_MOVE_RIGHT: ((), "L"),
-        ACT_BOX_CLICK: ((), MouseLeft),
-        ACT_BOX_CLICK_ADD: ((Control,), MouseLeft),
-        ACT_CHANGE_MOUSE_MODE: ((), MouseRight),
-        ACT_INCR_SPEED: ((), MouseWheelScrollUp),
-        ACT_DECR_SPEED: ((), MouseWheelScrollDown),
-        ACT_INCR_SELECT_DISTANCE: ((), "Y"),
-        ACT_DECR_SELECT_DISTANCE: ((), "H"),
-        ACT_DESELECT_ALL_BOXES: ((Control, Shift), "D"),
-        ACT_DELESECT_BOX: ((Control,), "D"),
-        ACT_INSPECT_BLOCK: ((), Alt),
-        ACT_CHANGE_PROJECTION: ((), Tab),
+        ACT_MOVE_UP: _key((), Space),
+        ACT_MOVE_DOWN: _key((), ";"),
+        ACT_MOVE_FORWARDS: _key((), "I"),
+        ACT_MOVE_BACKWARDS: _key((), "K"),
+        ACT_MOVE_LEFT: _key((), "J"),
+        ACT_MOVE_RIGHT: _key((), "L"),
+        ACT_BOX_CLICK: _key((), MouseLeft),
+        ACT_BOX_CLICK_ADD: _key((Control,), MouseLeft),
+        ACT_CHANGE_MOUSE_MODE: _key((), MouseRight),
+        ACT_INCR_SPEED: _key((), MouseWheelScrollUp),
+        ACT_DECR_SPEED: _key((), MouseWheelScrollDown),
+        ACT_INCR_SELECT_DISTANCE: _key((), "Y"),
+        ACT_DECR_SELECT_DISTANCE: _key((), "H"),
+        ACT_DESELECT_ALL_BOXES: _key((Control, Shift), "D"),
+        ACT_DELESECT_BOX: _key((Control,), "D"),
+        ACT_INSPECT_BLOCK: _key((), Alt),
+        ACT_CHANGE_PROJECTION: _key((), Tab),
     },
     "left_laptop": {
-        ACT_MOVE_UP: ((), Space),
-        ACT_MOVE_DOWN: ((), ";"),
-        ACT_MOVE_FORWARDS: ((), "I"),
-        ACT_MOVE_BACKWARDS: ((), "K"),
-        ACT_MOVE_LEFT: ((), "J"),
-        ACT_MOVE_RIGHT: ((), "L"),
-        ACT_BOX_CLICK: ((), MouseLeft),
-        ACT_BOX_CLICK_ADD: ((Control,), MouseLeft),
-        ACT_CHANGE_MOUSE_MODE: ((), MouseRight),
-        ACT_INCR_SPEED: ((), "."),
-        ACT_DECR_SPEED: ((), ","),
-        ACT_INCR_SELECT_DISTANCE: ((), "Y"),
-        ACT_DECR_SELECT_DISTANCE: ((), "H"),
-        ACT_DESELECT_ALL_BOXES: ((Control, Shift), "D"),
-        ACT_DELESECT_BOX: ((Control,), "D"),
-        ACT_INSPECT_BLOCK: ((), Alt),
-        ACT_CHANGE_PROJECTION: ((), Tab),
+        ACT_MOVE_UP: _key((), Space),
+        ACT_MOVE_DOWN: _key((), ";"),
+        ACT_MOVE_FORWARDS: _key((), "I"),
+        ACT_MOVE_BACKWARDS: _key((), "K"),
+        ACT_MOVE_LEFT: _key((), "J"),
+        ACT_MOVE_RIGHT: _key((), "L"),
+        ACT_BOX_CLICK: _key((), MouseLeft),
+        ACT_BOX_CLICK_ADD: _key((Control,), MouseLeft),
+        ACT_CHANGE_MOUSE_MODE: _key((), MouseRight),
+        ACT_INCR_SPEED: _key((), "."),
+        ACT_DECR_SPEED: _key((), ","),
+        ACT_INCR_SELECT_DISTANCE: _key((), "Y"),
+        ACT_DECR_SELECT_DISTANCE: _key((), "H"),
+        ACT_DESELECT_ALL_BOXES: _key((Control, Shift), "D"),
+        ACT_DELESECT_BOX: _key((Control,), "D"),
+        ACT_INSPECT_BLOCK: _key((), Alt),
+        ACT_CHANGE_PROJECTION: _key((), Tab),
     },
 }
 
+# the presets are shared so they are exposed read only.
+PresetKeybinds: Mapping[
+    KeybindGroupIdType, Mapping[KeyActionType, SerialisedKeyType]
+] = MappingProxyType(
+    {group_id: MappingProxyType(group) for group_id, group in _presets.items()}
+)
+
 DefaultKeybindGroupId: KeybindGroupIdType = "right"
-DefaultKeys: KeybindGroup = PresetKeybinds[DefaultKeybindGroupId]
+DefaultKeys: Mapping[KeyActionType, SerialisedKeyType] = PresetKeybinds[
+    DefaultKeybindGroupId
+]
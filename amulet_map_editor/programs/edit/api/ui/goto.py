@@ -77,15 +77,15 @@ class GoTo(SimpleDialog):
         return self.x.GetValue(), self.y.GetValue(), self.z.GetValue()
 
     def _on_text(self, evt):
-        if evt.ControlDown() and evt.GetKeyCode() == 3:
-            # Ctrl+C
-            self._copy()
-        elif evt.ControlDown() and evt.GetKeyCode() == 22:
-            # Ctrl+V
-            if not self._paste():
-                evt.Skip()
-        else:
-            evt.Skip()
+        if evt.ControlDown():
+            handler = self._CTRL_KEY_HANDLERS.get(evt.GetKeyCode())
+            if handler is not None and handler(self):
+                return
+        evt.Skip()
+
+    def _on_copy_key(self) -> bool:
+        self._copy()
+        return True
 
     def _copy(self):
         if wx.TheClipboard.Open():
@@ -115,3 +115,10 @@ class GoTo(SimpleDialog):
             self.z.SetValue(float(match.group("z")))
             return True
         return False
+
+    # Ctrl+<key> handlers looked up by key code.
+    # A handler returns True if it consumed the key press.
+    _CTRL_KEY_HANDLERS = {
+        3: _on_copy_key,  # Ctrl+C
+        22: _paste,  # Ctrl+V
+    }
@@ -1,12 +1,10 @@
 from typing import Tuple
 import wx
 
-import weakref
-import numpy
 import math
+from functools import lru_cache
 
 from amulet_map_editor.api.opengl.camera import Camera
-from amulet_map_editor.api.opengl.matrix import rotation_matrix_xy
 from amulet_map_editor.programs.edit.api.key_config import (
     KeybindGroup,
     ACT_MOVE_UP,
@@ -28,16 +26,24 @@ from amulet_map_editor.api.wx.util.button_input import (
 )
 
 
-_MoveActions = {
-    ACT_MOVE_UP,
-    ACT_MOVE_DOWN,
-    ACT_MOVE_FORWARDS,
-    ACT_MOVE_BACKWARDS,
-    ACT_MOVE_LEFT,
-    ACT_MOVE_RIGHT,
+# the offset each move action contributes.
+_MOVE_DELTA = {
+    ACT_MOVE_LEFT: (1, 0, 0),
+    ACT_MOVE_RIGHT: (-1, 0, 0),
+    ACT_MOVE_UP: (0, 1, 0),
+    ACT_MOVE_DOWN: (0, -1, 0),
+    ACT_MOVE_FORWARDS: (0, 0, 1),
+    ACT_MOVE_BACKWARDS: (0, 0, -1),
 }
 
 
+@lru_cache(maxsize=8)
+def _yaw_trig(ry: int) -> Tuple[float, float]:
+    """The cos and sin of a snapped camera yaw. Shared between all buttons."""
+    angle = -math.radians(ry)
+    return math.cos(angle), math.sin(angle)
+
+
 class NudgeButton(wx.Button):
     """A button that catches actions when pressed."""
 
@@ -51,7 +57,8 @@ class NudgeButton(wx.Button):
     ):
         super().__init__(parent, label=label)
         self.SetToolTip(tooltip)
-        self._camera = weakref.ref(camera)
+        # the button lives within the canvas so a strong reference is fine.
+        self._camera = camera
         self._buttons = ButtonInput(self)
         self._buttons.register_actions(keybinds)
         self._buttons.bind_events()  # this is fine here because we are binding to a custom button not the canvas.
@@ -63,7 +70,7 @@ class NudgeButton(wx.Button):
 
     @property
     def camera(self) -> Camera:
-        return self._camera()
+        return self._camera
 
     def enable(self):
         self._buttons.enable()
@@ -74,7 +81,7 @@ class NudgeButton(wx.Button):
     def _on_down(self, evt: InputPressEvent):
         if evt.action_id == ACT_BOX_CLICK:
             self._listen = True
-        elif evt.action_id in _MoveActions:
+        elif evt.action_id in _MOVE_DELTA:
             self._timeout = 10
 
     def _on_up(self, evt: InputReleaseEvent):
@@ -85,37 +92,21 @@ class NudgeButton(wx.Button):
         if self._listen:
             if self._timeout == 0 or self._timeout == 10:
                 x = y = z = 0
-                if ACT_MOVE_LEFT in evt.action_ids:
-                    x += 1
-                if ACT_MOVE_RIGHT in evt.action_ids:
-                    x -= 1
-                if ACT_MOVE_UP in evt.action_ids:
-                    y += 1
-                if ACT_MOVE_DOWN in evt.action_ids:
-                    y -= 1
-                if ACT_MOVE_FORWARDS in evt.action_ids:
-                    z += 1
-                if ACT_MOVE_BACKWARDS in evt.action_ids:
-                    z -= 1
-                if any((x, y, z)):
+                for action_id in _MOVE_DELTA.keys() & evt.action_ids:
+                    dx, dy, dz = _MOVE_DELTA[action_id]
+                    x += dx
+                    y += dy
+                    z += dz
+                if x or y or z:
                     self._move(self._rotate((x, y, z)))
             if self._timeout:
                 self._timeout -= 1
 
     def _rotate(self, offset: Tuple[int, int, int]) -> Tuple[int, int, int]:
         x, y, z = offset
-        ry = self.camera.rotation[0]
-        x, y, z, _ = (
-            numpy.round(
-                numpy.matmul(
-                    rotation_matrix_xy(0, -math.radians(round(ry / 90) * 90)),
-                    (x, y, z, 0),
-                )
-            )
-            .astype(int)
-            .tolist()
-        )
-        return x, y, z
+        # snap to the nearest 90 degrees and rotate about the y axis only.
+        c, s = _yaw_trig(round(self.camera.rotation[0] / 90) * 90)
+        return round(c * x + s * z), y, round(-s * x + c * z)
 
     def _move(self, offset: Tuple[int, int, int]):
         pass
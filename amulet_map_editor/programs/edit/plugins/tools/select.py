@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Type, Any, Callable, Tuple
+from typing import TYPE_CHECKING, Type, Any, Callable, Tuple, Optional
 import wx
 from OpenGL.GL import (
     glClear,
@@ -31,6 +31,12 @@ if TYPE_CHECKING:
     from amulet_map_editor.programs.edit.api.canvas import EditCanvas
 
 
+# which points of the selection a move button shifts.
+_MOVE_POINT1 = 0
+_MOVE_POINT2 = 1
+_MOVE_BOTH = 2
+
+
 class BaseSelectionMoveButton(NudgeButton):
     def __init__(
         self,
@@ -40,34 +46,22 @@ class BaseSelectionMoveButton(NudgeButton):
         label: str,
         tooltip: str,
         selection: BlockSelectionBehaviour,
+        which: int = _MOVE_BOTH,
     ):
         super().__init__(parent, camera, keybinds, label, tooltip)
         self._selection = selection
+        self._which = which
 
-
-class Point1MoveButton(BaseSelectionMoveButton):
-    def _move(self, offset: Tuple[int, int, int]):
-        ox, oy, oz = offset
-        (x, y, z), point2 = self._selection.active_block_positions
-        self._selection.active_block_positions = (x + ox, y + oy, z + oz), point2
-
-
-class Point2MoveButton(BaseSelectionMoveButton):
-    def _move(self, offset: Tuple[int, int, int]):
-        ox, oy, oz = offset
-        point1, (x, y, z) = self._selection.active_block_positions
-        self._selection.active_block_positions = point1, (x + ox, y + oy, z + oz)
-
-
-class SelectionMoveButton(BaseSelectionMoveButton):
     def _move(self, offset: Tuple[int, int, int]):
         ox, oy, oz = offset
-        (x1, y1, z1), (x2, y2, z2) = self._selection.active_block_positions
-        self._selection.active_block_positions = (x1 + ox, y1 + oy, z1 + oz), (
-            x2 + ox,
-            y2 + oy,
-            z2 + oz,
-        )
+        point1, point2 = self._selection.active_block_positions
+        if self._which != _MOVE_POINT2:
+            x, y, z = point1
+            point1 = (x + ox, y + oy, z + oz)
+        if self._which != _MOVE_POINT1:
+            x, y, z = point2
+            point2 = (x + ox, y + oy, z + oz)
+        self._selection.active_block_positions = point1, point2
 
 
 class SelectTool(wx.BoxSizer, DefaultBaseToolUI):
@@ -197,6 +191,11 @@ class SelectTool(wx.BoxSizer, DefaultBaseToolUI):
         self._y2.SetBackgroundColour((150, 150, 215))
         self._z2.SetBackgroundColour((150, 150, 215))
 
+        # the values last written to the inputs. Used to skip unchanged inputs.
+        self._last_points: Tuple[Optional[int], ...] = (None,) * 6
+        # set while the inputs are being changed from code.
+        self._suppress_input_event = False
+
         self._box_size_selector_fstring = lang.get(
             "program_3d_edit.select_tool.box_size_selector_fstring"
         )
@@ -221,68 +220,87 @@ class SelectTool(wx.BoxSizer, DefaultBaseToolUI):
             lang.get("program_3d_edit.select_tool.box_size_tooltip")
         )
 
-        self._point1_move = Point1MoveButton(
+        # the move buttons are created when the tool is first enabled.
+        self._point1_move: Optional[BaseSelectionMoveButton] = None
+        self._point2_move: Optional[BaseSelectionMoveButton] = None
+        self._selection_move: Optional[BaseSelectionMoveButton] = None
+
+    @property
+    def name(self) -> str:
+        return "Select"
+
+    def bind_events(self):
+        super().bind_events()
+        self.canvas.Bind(EVT_RENDER_BOX_CHANGE, self._box_renderer_change)
+        self.canvas.Bind(EVT_RENDER_BOX_DISABLE_INPUTS, self._disable_inputs)
+        self.canvas.Bind(EVT_RENDER_BOX_ENABLE_INPUTS, self._enable_inputs)
+        self.canvas.Bind(EVT_SELECTION_CHANGE, self._on_selection_change)
+        self._selection.bind_events()
+        self._inspect_block.bind_events()
+
+    def enable(self):
+        super().enable()
+        self._ensure_move_buttons()
+        self._selection.enable()
+        self._pull_selection()
+        self._point1_move.enable()
+        self._point2_move.enable()
+        self._selection_move.enable()
+
+    def disable(self):
+        super().disable()
+        if self._point1_move is not None:
+            self._point1_move.disable()
+            self._point2_move.disable()
+            self._selection_move.disable()
+
+    def _ensure_move_buttons(self):
+        if self._point1_move is not None:
+            return
+        button_sizer = self._button_panel.GetSizer()
+        # match the current state of the inputs.
+        enabled = self._x1.IsEnabled()
+
+        self._point1_move = BaseSelectionMoveButton(
             self._button_panel,
             self.canvas.camera,
             self.canvas.key_binds,
             lang.get("program_3d_edit.select_tool.button_point1"),
             lang.get("program_3d_edit.select_tool.button_point1_tooltip"),
             self._selection,
+            _MOVE_POINT1,
         )
         self._point1_move.SetBackgroundColour((160, 215, 145))
-        self._point1_move.Disable()
+        self._point1_move.Enable(enabled)
         button_sizer.Add(self._point1_move, 0, wx.ALL | wx.EXPAND, 5)
 
-        self._point2_move = Point2MoveButton(
+        self._point2_move = BaseSelectionMoveButton(
             self._button_panel,
             self.canvas.camera,
             self.canvas.key_binds,
             lang.get("program_3d_edit.select_tool.button_point2"),
             lang.get("program_3d_edit.select_tool.button_point2_tooltip"),
             self._selection,
+            _MOVE_POINT2,
         )
         self._point2_move.SetBackgroundColour((150, 150, 215))
-        self._point2_move.Disable()
+        self._point2_move.Enable(enabled)
         button_sizer.Add(self._point2_move, 0, wx.ALL | wx.EXPAND, 5)
 
-        self._selection_move = SelectionMoveButton(
+        self._selection_move = BaseSelectionMoveButton(
             self._button_panel,
             self.canvas.camera,
             self.canvas.key_binds,
             lang.get("program_3d_edit.select_tool.button_selection_box"),
             lang.get("program_3d_edit.select_tool.button_selection_box_tooltip"),
             self._selection,
+            _MOVE_BOTH,
         )
         self._selection_move.SetBackgroundColour((255, 255, 255))
-        self._selection_move.Disable()
+        self._selection_move.Enable(enabled)
         button_sizer.Add(self._selection_move, 0, wx.ALL | wx.EXPAND, 5)
-
-    @property
-    def name(self) -> str:
-        return "Select"
-
-    def bind_events(self):
-        super().bind_events()
-        self.canvas.Bind(EVT_RENDER_BOX_CHANGE, self._box_renderer_change)
-        self.canvas.Bind(EVT_RENDER_BOX_DISABLE_INPUTS, self._disable_inputs)
-        self.canvas.Bind(EVT_RENDER_BOX_ENABLE_INPUTS, self._enable_inputs)
-        self.canvas.Bind(EVT_SELECTION_CHANGE, self._on_selection_change)
-        self._selection.bind_events()
-        self._inspect_block.bind_events()
-
-    def enable(self):
-        super().enable()
-        self._selection.enable()
-        self._pull_selection()
-        self._point1_move.enable()
-        self._point2_move.enable()
-        self._selection_move.enable()
-
-    def disable(self):
-        super().disable()
-        self._point1_move.disable()
-        self._point2_move.disable()
-        self._selection_move.disable()
+        self._button_panel.InvalidateBestSize()
+        self.Layout()
 
     def _add_row(self, label: str, wx_object: Type[wx.Object], **kwargs) -> Any:
         sizer = wx.BoxSizer(wx.HORIZONTAL)
@@ -294,9 +312,25 @@ class SelectTool(wx.BoxSizer, DefaultBaseToolUI):
         return obj
 
     def _box_input_change(self, _):
-        self._selection.active_block_positions = (
-            (self._x1.GetValue(), self._y1.GetValue(), self._z1.GetValue()),
-            (self._x2.GetValue(), self._y2.GetValue(), self._z2.GetValue()),
+        if self._suppress_input_event:
+            # some platforms send EVT_SPINCTRL for SetValue
+            return
+        points = self._current_points()
+        if points == self._last_points:
+            # the selection already has these values
+            return
+        self._last_points = points
+        self._selection.active_block_positions = points[:3], points[3:]
+
+    def _current_points(self) -> Tuple[int, int, int, int, int, int]:
+        """The values of the six coordinate inputs."""
+        return (
+            self._x1.GetValue(),
+            self._y1.GetValue(),
+            self._z1.GetValue(),
+            self._x2.GetValue(),
+            self._y2.GetValue(),
+            self._z2.GetValue(),
         )
 
     def _box_renderer_change(self, evt: RenderBoxChangeEvent):
@@ -313,13 +347,23 @@ class SelectTool(wx.BoxSizer, DefaultBaseToolUI):
     def _update_selection_inputs(
         self, point1: BlockCoordinates, point2: BlockCoordinates
     ):
-        (x1, y1, z1), (x2, y2, z2) = point1, point2
-        self._x1.SetValue(x1)
-        self._y1.SetValue(y1)
-        self._z1.SetValue(z1)
-        self._x2.SetValue(x2)
-        self._y2.SetValue(y2)
-        self._z2.SetValue(z2)
+        points = (*point1, *point2)
+        # redraw the panel once rather than once per input.
+        self._button_panel.Freeze()
+        self._suppress_input_event = True
+        try:
+            for scroll, value, last_value in zip(
+                (self._x1, self._y1, self._z1, self._x2, self._y2, self._z2),
+                points,
+                self._last_points,
+            ):
+                if value != last_value:
+                    scroll.SetValue(value)
+        finally:
+            self._suppress_input_event = False
+            self._button_panel.Thaw()
+        self._last_points = points
+        x1, y1, z1, x2, y2, z2 = points
         self._box_size_selector_text.SetLabel(
             self._box_size_selector_fstring.format(
                 x=int(abs(x2 - x1)),
@@ -334,21 +378,25 @@ class SelectTool(wx.BoxSizer, DefaultBaseToolUI):
 
     def _enable_inputs(self, evt):
         self._set_scroll_state(True)
-        self._point1_move.Enable()
-        self._point2_move.Enable()
-        self._selection_move.Enable()
+        if self._point1_move is not None:
+            self._point1_move.Enable()
+            self._point2_move.Enable()
+            self._selection_move.Enable()
         evt.Skip()
 
     def _disable_inputs(self, evt):
         self._set_scroll_state(False)
-        self._point1_move.Disable()
-        self._point2_move.Disable()
-        self._selection_move.Disable()
+        if self._point1_move is not None:
+            self._point1_move.Disable()
+            self._point2_move.Disable()
+            self._selection_move.Disable()
         evt.Skip()
 
     def _set_scroll_state(self, state: bool):
+        self._button_panel.Freeze()
         for scroll in (self._x1, self._y1, self._z1, self._x2, self._y2, self._z2):
             scroll.Enable(state)
+        self._button_panel.Thaw()
 
     def _on_draw(self, evt):
         self.canvas.renderer.start_draw()